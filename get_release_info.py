@@ -1,116 +1,349 @@
 #!/usr/bin/env python
 
-import requests
+import asyncio
+import functools
+import httpx
 import openai
-import json
+import orjson
 import os
-import hashlib
+import random
+import sqlite3
 import textwrap
+import tiktoken
+import time
+from collections import deque
 from datetime import datetime
 from pprint import pformat
+from urllib.parse import urlparse, parse_qs
 
 CACHE_DIR = "release_cache"
 if not os.path.exists(CACHE_DIR):
     os.makedirs(CACHE_DIR)
 
-def get_cache_filename(repo_name, tag_name):
-    hash_object = hashlib.md5(f"{repo_name}-{tag_name}".encode())
-    return os.path.join(CACHE_DIR, f"{hash_object.hexdigest()}.json")
+# Cap on in-flight LLM requests so we stay under the API's RPM limits
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('MAX_CONCURRENT_REQUESTS', 8))
+MAX_RETRIES = 3
+# How many releases to pack into a single chat completion request
+BATCH_SIZE = int(os.environ.get('BATCH_SIZE', 5))
+
+BATCH_PROMPT_SUFFIX = (
+    "\nYou will receive a JSON array of releases. Respond with a well-formed JSON "
+    "dictionary of the form {\"results\": [...]} containing one analysis per release, "
+    "in the same order as the input array."
+)
+
+RELEASE_FIELDS = ('name', 'tag_name', 'published_at', 'body', 'prerelease', 'mentions_count', 'draft')
+
+# The completion kwargs never change per call; build them once instead of
+# reallocating the dict in the hot loop (max_tokens varies by batch size)
+BASE_COMPLETION_KWARGS = {
+    "model": "gpt-4o",
+    "temperature": 0.25,
+    "top_p": 1,
+    "frequency_penalty": 0,
+    "presence_penalty": 0,
+    "response_format": {"type": "json_object"},
+    "stream": True
+}
+
+def make_system_message(text):
+    return {"role": "system", "content": [{"type": "text", "text": text}]}
+
+# Sliding-window token budget so we pre-throttle instead of tripping the
+# provider's TPM limit and burning a retry
+TPM_LIMIT = int(os.environ.get('OPENAI_TPM_LIMIT', 450000))
+TOKEN_WINDOW_SECONDS = 60
+_token_window = deque()
+
+@functools.lru_cache(maxsize=1)
+def get_encoding():
+    return tiktoken.encoding_for_model("gpt-4o")
+
+def estimate_tokens(messages):
+    encoding = get_encoding()
+    return sum(
+        len(encoding.encode(part['text']))
+        for message in messages
+        for part in message['content']
+    )
+
+async def reserve_tokens(tokens):
+    # Block until the estimated spend fits inside the 60-second window
+    while True:
+        now = time.monotonic()
+        while _token_window and (now - _token_window[0][0]) > TOKEN_WINDOW_SECONDS:
+            _token_window.popleft()
+        spent = sum(count for (_, count) in _token_window)
+        if (spent + tokens) <= TPM_LIMIT or not _token_window:
+            _token_window.append((now, tokens))
+            return
+        await asyncio.sleep(TOKEN_WINDOW_SECONDS - (now - _token_window[0][0]))
+
+# One SQLite store replaces the per-release JSON files: a single file
+# descriptor and indexed lookups instead of a stat+open+read per release
+def get_cache_db():
+    conn = sqlite3.connect(os.path.join(CACHE_DIR, "releases.db"))
+    conn.execute("CREATE TABLE IF NOT EXISTS releases(repo TEXT, tag TEXT, payload TEXT, PRIMARY KEY(repo, tag))")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+_cache_db = get_cache_db()
 
 def cache_release_data(repo_name, tag_name, data):
-    cache_file = get_cache_filename(repo_name, tag_name)
-    with open(cache_file, 'w') as f:
-        json.dump(data, f)
+    _cache_db.execute(
+        "INSERT OR REPLACE INTO releases(repo, tag, payload) VALUES (?, ?, ?)",
+        (repo_name, tag_name, orjson.dumps(data).decode())
+    )
+    _cache_db.commit()
 
 def load_cached_release(repo_name, tag_name):
-    cache_file = get_cache_filename(repo_name, tag_name)
-    if os.path.exists(cache_file):
-        with open(cache_file, 'r') as f:
-            return json.load(f)
+    row = _cache_db.execute(
+        "SELECT payload FROM releases WHERE repo = ? AND tag = ?",
+        (repo_name, tag_name)
+    ).fetchone()
+    if row is not None:
+        return orjson.loads(row[0])
     return None
 
-def get_releases(repo_name):
+GITHUB_HEADERS = {
+    'Accept': 'application/vnd.github+json',
+    'Accept-Encoding': 'gzip'
+}
+ETAG_CACHE_FILE = os.path.join(CACHE_DIR, '_etags.json')
+RETRY_STATUS_CODES = (502, 503, 504)
+
+def load_etag_cache():
+    if os.path.exists(ETAG_CACHE_FILE):
+        with open(ETAG_CACHE_FILE, 'rb') as fh:
+            return orjson.loads(fh.read())
+    return {}
+
+def save_etag_cache(etags):
+    with open(ETAG_CACHE_FILE, 'wb') as fh:
+        fh.write(orjson.dumps(etags))
+
+async def fetch_release_page(client, url, repo_name, page, etags):
+    # Conditional request: if GitHub still has the same ETag for this page
+    # it answers 304 with an empty body and we reuse the cached payload
+    headers = {}
+    etag_key = f"{repo_name}:{page}"
+    cached = etags.get(etag_key)
+    if cached:
+        headers['If-None-Match'] = cached['etag']
+
+    for attempt in range(3):
+        response = await client.get(url, params={'per_page': 100, 'page': page}, headers=headers)
+        if response.status_code in RETRY_STATUS_CODES:
+            await asyncio.sleep(0.5 * (2 ** attempt))
+            continue
+        break
+
+    if response.status_code == 304:
+        return (304, cached['body'], response)
+    if response.status_code == 200:
+        # The body is valid regardless; the etag entry only makes sense
+        # when GitHub actually sent the header
+        body = response.json()
+        if 'ETag' in response.headers:
+            etags[etag_key] = {'etag': response.headers['ETag'], 'body': body}
+        return (200, body, response)
+    return (response.status_code, None, response)
+
+async def fetch_release_pages(repo_name):
     url = f"https://api.github.com/repos/{repo_name}/releases"
-    params = {'per_page': 100, 'page': 1}
-    
-    while True:
-        response = requests.get(url, params=params)
-
-        if response.status_code == 200:
-            releases = response.json()
-            if releases:
-                for release in releases:
-                    release_info = {
-                        'name': release.get('name'),
-                        'tag_name': release.get('tag_name'),
-                        'published_at': release.get('published_at'),
-                        'body': release.get('body'),
-                        'prerelease': release.get('prerelease'),
-                        'mentions_count': int(release.get('mentions_count', 0)),
-                        'draft': release.get('draft')
-                    }
-                    yield release_info
-            else:
-                if params['page'] == 1:
-                    print("No releases found for this repository.")
-                break
-            params['page'] += 1
-        elif response.status_code == 404:
+    etags = load_etag_cache()
+
+    # Keep one client alive for the whole pagination so every page reuses
+    # the same TCP+TLS connection to api.github.com
+    async with httpx.AsyncClient(headers=GITHUB_HEADERS) as client:
+        (status, body, response) = await fetch_release_page(client, url, repo_name, 1, etags)
+        if status == 404:
             print("Error: Repository not found. Please check the repository name.")
-            break
+            return None
+        if status not in (200, 304):
+            print(f"Error: Unable to fetch releases. Status code: {status}")
+            return None
+
+        pages = [body]
+
+        # The Link header's rel="last" tells us the page count up front, so
+        # the remaining pages can be fetched concurrently instead of one
+        # round-trip at a time
+        last_link = response.links.get('last')
+        if last_link:
+            last_page = int(parse_qs(urlparse(last_link['url']).query)['page'][0])
+            etags[f"{repo_name}:last_page"] = last_page
         else:
-            print(f"Error: Unable to fetch releases. Status code: {response.status_code}")
-            break
+            # 304 responses may omit the Link header, so fall back to the
+            # page count recorded the last time we saw a 200
+            last_page = etags.get(f"{repo_name}:last_page", 1) if status == 304 else 1
+
+        if last_page > 1:
+            results = await asyncio.gather(*[
+                fetch_release_page(client, url, repo_name, page, etags)
+                for page in range(2, last_page + 1)
+            ])
+            for (status, body, response) in results:
+                if status not in (200, 304):
+                    print(f"Error: Unable to fetch releases. Status code: {status}")
+                    return None
+                pages.append(body)
+
+        save_etag_cache(etags)
+        return pages
+
+def get_releases(repo_name):
+    pages = asyncio.run(fetch_release_pages(repo_name))
+    if pages is None:
+        return
+    if not pages[0]:
+        print("No releases found for this repository.")
+        return
+
+    for releases in pages:
+        for release in releases:
+            release_info = {
+                'name': release.get('name'),
+                'tag_name': release.get('tag_name'),
+                'published_at': release.get('published_at'),
+                'body': release.get('body'),
+                'prerelease': release.get('prerelease'),
+                'mentions_count': int(release.get('mentions_count', 0)),
+                'draft': release.get('draft')
+            }
+            yield release_info
+
+async def analyze_one(acli, semaphore, system_msg, release):
+    body = release['body'] or "None"
+    release_text = (
+        f"Release Name: {release['name']}\n"
+        f"Tag Name: {release['tag_name']}\n"
+        f"Published Date: {release['published_at']}\n"
+        f"Body: {body}\n"
+        f"Pre-release: {release['prerelease']}\n"
+        f"Mentions Count: {release.get('mentions_count', 'None')}\n"
+        f"Draft: {release.get('draft', 'None')}"
+    )
+
+    messages = [
+        system_msg,
+        {"role": "user", "content": [{"type": "text", "text": release_text}]}
+    ]
+
+    analysis_result = {}
+    error = None
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                await reserve_tokens(estimate_tokens(messages) + 2048)
+                stream = await acli.chat.completions.create(
+                    messages=messages, max_tokens=2048, **BASE_COMPLETION_KWARGS
+                )
+                # Accumulate deltas as they arrive so buffering overlaps
+                # with generation instead of waiting for the full response
+                chunks = []
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        chunks.append(chunk.choices[0].delta.content)
+                analysis_result = orjson.loads(''.join(chunks).strip())
+                error = None
+                break
+            except (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError) as e:
+                # Transient API failure: exponential backoff with jitter, then retry
+                error = e
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep((2 ** attempt) + random.random())
+            except Exception as e:
+                error = e
+                break
+
+    if error is not None:
+        print(f"Error processing LLM response for release {release['name']}: {error}")
+
+    # Update release dictionary with analysis
+    release['analysis'] = analysis_result if analysis_result else {}
+    return (release, error)
+
+async def analyze_batch(acli, semaphore, system_msg, batch_system_msg, releases):
+    # Pack several releases into one request so the system prompt is only
+    # paid for once per batch instead of once per release.
+    payload = orjson.dumps([
+        {field: release.get(field) for field in RELEASE_FIELDS}
+        for release in releases
+    ]).decode()
+
+    messages = [
+        batch_system_msg,
+        {"role": "user", "content": [{"type": "text", "text": payload}]}
+    ]
+
+    try:
+        async with semaphore:
+            await reserve_tokens(estimate_tokens(messages) + min(2048 * len(releases), 16384))
+            stream = await acli.chat.completions.create(
+                messages=messages, max_tokens=min(2048 * len(releases), 16384), **BASE_COMPLETION_KWARGS
+            )
+            chunks = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    chunks.append(chunk.choices[0].delta.content)
+        results = orjson.loads(''.join(chunks).strip()).get('results')
+        if not isinstance(results, list) or len(results) != len(releases):
+            raise ValueError(f"Expected {len(releases)} analyses, got {results!r}")
+    except Exception as e:
+        # Bad batch: retry each release individually rather than discarding
+        # the whole batch
+        print(f"Batch analysis failed ({e}), retrying releases individually")
+        tasks = [asyncio.create_task(analyze_one(acli, semaphore, system_msg, release)) for release in releases]
+        return await asyncio.gather(*tasks)
+
+    analyzed = []
+    for (release, analysis_result) in zip(releases, results):
+        release['analysis'] = analysis_result if analysis_result else {}
+        analyzed.append((release, None))
+    return analyzed
+
+async def analyze_uncached_releases(prompt, releases):
+    acli = openai.AsyncOpenAI()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    system_msg = make_system_message(prompt)
+    batch_system_msg = make_system_message(prompt + BATCH_PROMPT_SUFFIX)
+    batches = [releases[idx:idx + BATCH_SIZE] for idx in range(0, len(releases), BATCH_SIZE)]
+    tasks = [asyncio.create_task(analyze_batch(acli, semaphore, system_msg, batch_system_msg, batch)) for batch in batches]
+    results = await asyncio.gather(*tasks)
+    return [entry for batch_result in results for entry in batch_result]
 
 def analyze_releases(repo_name, prompt, continue_on_error=True):
-    cli = openai.OpenAI()
-    
+    # Split releases into a cached fast path and the set that still needs
+    # an LLM round-trip; the latter are analyzed concurrently.
+    ordered = []
+    uncached = []
     for release in get_releases(repo_name):
-        # Check if the release is already cached
         cached_release = load_cached_release(repo_name, release['tag_name'])
         if cached_release:
             dt = datetime.strptime(cached_release['published_at'], '%Y-%m-%dT%H:%M:%SZ')
             cached_release['published_at'] = dt.date().isoformat()
-            yield cached_release
-            continue
-
-        release_text = (
-            "Release Name: " + release['name'] + "\n" +
-            "Tag Name: " + release['tag_name'] + "\n" +
-            "Published Date: " + release['published_at'] + "\n" +
-            "Body: " + (release['body'] if release['body'] else "None") + "\n" +
-            "Pre-release: " + str(release['prerelease']) + "\n" +
-            "Mentions Count: " + str(release.get('mentions_count', 'None')) + "\n" +
-            "Draft: " + str(release.get('draft', 'None'))
-        )
-        
-        messages = [
-            {"role": "system", "content": [{"type": "text", "text": prompt}]},
-            {"role": "user", "content": [{"type": "text", "text": release_text}]}
-        ]
-
-        analysis_result = {}
-        try:
-            resp = cli.chat.completions.create(
-                model="gpt-4o",
-                messages=messages,
-                temperature=0.25,
-                max_tokens=2048,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0,
-                response_format={"type": "json_object"}
-            )
-            analysis_result = json.loads(str(resp.choices[0].message.content).strip())
-        except Exception as e:
-            print(f"Error processing LLM response for release {release['name']}: {e}")
-            if not continue_on_error:
-                break
+            ordered.append((cached_release, None))
+        else:
+            slot = [release, None]
+            ordered.append(slot)
+            uncached.append(slot)
 
-        # Update release dictionary with analysis
-        release['analysis'] = analysis_result if analysis_result else {}
-        cache_release_data(repo_name, release['tag_name'], release)
+    if uncached:
+        results = asyncio.run(analyze_uncached_releases(prompt, [slot[0] for slot in uncached]))
+        for slot, (release, error) in zip(uncached, results):
+            # Only cache analyses that actually succeeded; a failed or
+            # empty result would otherwise be served as a hit forever
+            # instead of being retried on the next run
+            if error is None and release['analysis']:
+                cache_release_data(repo_name, release['tag_name'], release)
+            slot[0] = release
+            slot[1] = error
 
+    for (release, error) in ordered:
+        if error is not None and not continue_on_error:
+            break
         yield release
 
 # Example prompt to send to LLM
@@ -146,5 +379,5 @@ def get_version_data(repo_name, prompt, continue_on_error=False):
 
 repo_name = 'broadinstitute/gatk'
 versions = get_version_data(repo_name, prompt)
-with open('gatk_versions.json', 'w') as fh:
-    json.dump(versions, fh, indent=2)
+with open('gatk_versions.json', 'wb') as fh:
+    fh.write(orjson.dumps(versions, option=orjson.OPT_INDENT_2))
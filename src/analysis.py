@@ -1,15 +1,42 @@
 import os
 import json
+import functools
 from openai import OpenAI
 from datetime import datetime
 
 prompts_path = os.path.join(os.path.dirname(__file__), 'prompts')
-analyze_article_path = os.path.join(prompts_path, "analyze_article.txt")
 
-with open(analyze_article_path) as fh:
-    system_prompt = fh.read()
+@functools.lru_cache(maxsize=128)
+def find_prompt_file(name):
+    # Case-insensitive match against the prompt directory, scanned once
+    for fname in os.listdir(prompts_path):
+        if os.path.splitext(fname)[0].lower() == name.lower():
+            return os.path.join(prompts_path, fname)
+    raise FileNotFoundError(f"No prompt file found for '{name}' in {prompts_path}")
 
-def analyze_article(article_path):
+@functools.lru_cache(maxsize=32)
+def load_prompt(name):
+    with open(find_prompt_file(name)) as fh:
+        return fh.read()
+
+# One analysis kind -> prompt name; new analyses register here instead of
+# copying the OpenAI boilerplate below
+PROMPT_REGISTRY = {
+    'article': 'analyze_article',
+}
+
+BASE_COMPLETION_KWARGS = {
+    "model": "gpt-4o",
+    "temperature": 0.25,
+    "max_tokens": 2048,
+    "top_p": 1,
+    "frequency_penalty": 0,
+    "presence_penalty": 0,
+    "response_format": {"type": "json_object"}
+}
+
+def analyze_article(article_path, kind='article'):
+    system_prompt = load_prompt(PROMPT_REGISTRY[kind])
     with open(article_path) as fh:
         article_text = fh.read()
 
@@ -19,14 +46,5 @@ def analyze_article(article_path):
         {"role": "user", "content": [{"type": "text", "text": article_text}]},
     ]
 
-    resp = cli.chat.completions.create(
-        model="gpt-4o",
-        messages=messages,
-        temperature=0.25,
-        max_tokens=2048,
-        top_p=1,
-        frequency_penalty=0,
-        presence_penalty=0,
-        response_format={"type": "json_object"}
-    )
+    resp = cli.chat.completions.create(messages=messages, **BASE_COMPLETION_KWARGS)
     return json.loads(str(resp.choices[0].message.content).strip())
@@ -1,7 +1,32 @@
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+
+def extract_doi_metadata(doi_metadata, default_value="NA", now=None):
+    # Bind each subtree once instead of repeating the same dict lookups
+    # for every derived field
+    funders = doi_metadata.get("funder") or []
+    authors = doi_metadata.get("author") or []
+    references = doi_metadata.get("reference") or []
+    container_title = doi_metadata.get("container-title") or []
+    date_parts = (doi_metadata.get("published") or {}).get("date-parts")
+    first_date = date_parts[0] if date_parts else ()
+
+    # One walk over funders produces both names and awards
+    funder_names = []
+    funder_awards = []
+    for funder in funders:
+        funder_names.append(funder.get("name", "Unknown funder"))
+        funder_awards.extend(funder.get("award", []))
+
+    # Likewise one walk over authors for names and ORCIDs
+    author_names = []
+    author_orcids = []
+    for author in authors:
+        given = author.get('given')
+        family = author.get('family')
+        author_names.append(f"{given or ''} {family or ''}".strip() if given or family else default_value)
+        author_orcids.append(author.get("ORCID", default_value))
 
-def extract_doi_metadata(doi_metadata, default_value="NA"):
     extracted_data = {
         # Reference Count
         "reference_count": doi_metadata.get("reference-count", default_value),
@@ -9,37 +34,37 @@ def extract_doi_metadata(doi_metadata, default_value="NA"):
 
         # Publisher Information
         "publisher": doi_metadata.get("publisher", default_value),
-        "journal_title": doi_metadata.get("container-title", [default_value])[0] if doi_metadata.get("container-title", []) else default_value,
+        "journal_title": container_title[0] if container_title else default_value,
 
         # Funding Sources
-        "funder_names": [funder.get("name", "Unknown funder") for funder in doi_metadata.get("funder", [])],
-        "funder_awards": [award for funder in doi_metadata.get("funder", []) for award in funder.get("award", [])],
-        "number_of_funders": len(doi_metadata.get("funder", [])),
+        "funder_names": funder_names,
+        "funder_awards": funder_awards,
+        "number_of_funders": len(funders),
 
         # Publication Date & Timeline
-        "publication_year": doi_metadata.get("published", {}).get("date-parts", [[default_value]])[0][0] if doi_metadata.get("published", {}).get("date-parts", []) else default_value,
-        "publication_month": doi_metadata.get("published", {}).get("date-parts", [[None, default_value]])[0][1] if doi_metadata.get("published", {}).get("date-parts", []) else default_value,
+        "publication_year": first_date[0] if len(first_date) >= 1 else default_value,
+        "publication_month": first_date[1] if len(first_date) >= 2 else default_value,
 
         # Licensing Information
-        "licenses": list(set([license_info.get("URL", default_value) for license_info in doi_metadata.get("license", [])])),
+        "licenses": list({license_info.get("URL", default_value) for license_info in doi_metadata.get("license") or []}),
 
         # Ethics and Declarations
-        "ethics_declarations": [assertion.get("value", default_value) for assertion in doi_metadata.get("assertion", []) if assertion.get("group", {}).get("name") == "EthicsHeading"],
+        "ethics_declarations": [assertion.get("value", default_value) for assertion in doi_metadata.get("assertion") or [] if assertion.get("group", {}).get("name") == "EthicsHeading"],
 
         # Authors Information
-        "author_names": [f"{author.get('given', '')} {author.get('family', '')}".strip() if author.get('given') or author.get('family') else default_value for author in doi_metadata.get("author", [])],
-        "author_orcids": [author.get("ORCID", default_value) for author in doi_metadata.get("author", [])],
-        "author_count": len(doi_metadata.get("author", [])),
+        "author_names": author_names,
+        "author_orcids": author_orcids,
+        "author_count": len(authors),
 
         # References with DOI Links
-        "references_doi": [reference.get("DOI", default_value) for reference in doi_metadata.get("reference", []) if "DOI" in reference],
+        "references_doi": [reference["DOI"] for reference in references if "DOI" in reference],
 
         # Boolean Fields
         "is_published_print": "published-print" in doi_metadata,
         "is_published_online": "published-online" in doi_metadata,
 
         # timestamp
-        "_created_at": datetime.utcnow().isoformat()
+        "_created_at": now or datetime.now(timezone.utc).isoformat()
     }
 
     return extracted_data
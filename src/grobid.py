@@ -1,18 +1,38 @@
-from grobid_client.api.pdf import process_fulltext_document
-from grobid_client.models import Article, ProcessForm
-from grobid_client.types import TEI, File
-from grobid_client import Client
+import os
+import requests
+from concurrent.futures import ThreadPoolExecutor
 
-def extract_text(pdf_path, output_path=None, figures=False):
+GROBID_URL = os.environ.get("GROBID_URL", "http://localhost:8070/api")
+
+# Pooled session: keep the connection to the Grobid server alive across PDFs
+_SESSION = requests.Session()
+
+def extract_text(pdf_path, output_path=None):
     output_path = output_path or f'{pdf_path}.tei.xml'
-    client = Client(base_url="http://localhost:8070/api", timeout=60)
+    # POST straight to the fulltext endpoint. Note requests materializes
+    # the multipart body in memory (it read()s the handle to encode it),
+    # so only the response leg is streamed: the TEI is written to disk in
+    # chunks, keeping that side at O(chunk) instead of O(document)
     with open(pdf_path, "rb") as fh:
-        payload = File(file_name=pdf_path, payload=fh, mime_type="application/pdf")
-        form = ProcessForm(segment_sentences="1", input_=payload)
-        resp = process_fulltext_document.sync_detailed(client=client, multipart_data=form)
-        if not resp.is_success:
+        resp = _SESSION.post(
+            f"{GROBID_URL}/processFulltextDocument",
+            files={"input": (os.path.basename(pdf_path), fh, "application/pdf")},
+            data={"segmentSentences": "1"},
+            stream=True,
+            timeout=60,
+        )
+    with resp:
+        if not resp.ok:
             msg = f"Grobid failed to extract text from {pdf_path} ({resp.content})"
             raise ValueError(msg)
         with open(output_path, "wb") as outfh:
-            outfh.write(resp.content)
-        return TEI.parse(resp.content, figures=figures)
+            for chunk in resp.iter_content(65536):
+                outfh.write(chunk)
+    return output_path
+
+def extract_text_batch(pdf_paths, concurrency=10):
+    # The Grobid server is multithreaded, so keep `concurrency` uploads in
+    # flight (match it to the server's own concurrency setting); requests
+    # releases the GIL while waiting on the network
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        yield from zip(pdf_paths, pool.map(extract_text, pdf_paths))
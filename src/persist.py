@@ -1,72 +1,187 @@
-import json
+import orjson
 import os
-import tempfile
+import sqlite3
+from collections.abc import MutableMapping
+from contextlib import contextmanager
 
-class PersistentDict:
-    def __init__(self, filepath):
-        self.filepath = filepath
-        # Ensure the file exists
-        if not os.path.exists(self.filepath):
-            self._write_to_file({})
-
-    def _read_from_file(self):
-        with open(self.filepath, 'r') as f:
-            return json.load(f)
-
-    def _write_to_file(self, data):
-        # Create a temporary file and write JSON data
-        tmpfn = self.filepath + '_'
-        with open(tmpfn, 'w') as tempfh:
-            json.dump(data, tempfh, indent=4)
-            tempfh.flush()
-        # Rename temp file to target file path
-        os.sync()
-        os.replace(tmpfn, self.filepath)
+class StatusStore:
+    # One WAL-mode SQLite connection shared by every DOI in the process,
+    # instead of a whole-file JSON rewrite per status mutation
+    _instances = {}
 
-    def __getitem__(self, key):
-        data = self._read_from_file()
-        return data[key]
+    @classmethod
+    def get(cls, db_path):
+        if db_path not in cls._instances:
+            cls._instances[db_path] = cls(db_path)
+        return cls._instances[db_path]
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS status(doi TEXT, k TEXT, v TEXT, PRIMARY KEY(doi, k))")
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def namespace(self, doi):
+        return StatusProxy(self, doi)
+
+class StatusProxy:
+    # Dict-like view of one DOI's rows in the shared status store
+    def __init__(self, store, doi):
+        self.store = store
+        self.doi = doi
 
     def __setitem__(self, key, value):
-        data = self._read_from_file()
-        data[key] = value
-        self._write_to_file(data)
+        self.store.conn.execute(
+            "INSERT OR REPLACE INTO status(doi, k, v) VALUES (?, ?, ?)",
+            (self.doi, key, orjson.dumps(value).decode())
+        )
+
+    def __getitem__(self, key):
+        row = self.store.conn.execute(
+            "SELECT v FROM status WHERE doi = ? AND k = ?", (self.doi, key)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Key '{key}' not found in the dictionary.")
+        return orjson.loads(row[0])
 
     def __delitem__(self, key):
-        data = self._read_from_file()
-        if key in data:
-            del data[key]
-            self._write_to_file(data)
-        else:
+        cursor = self.store.conn.execute(
+            "DELETE FROM status WHERE doi = ? AND k = ?", (self.doi, key)
+        )
+        if cursor.rowcount == 0:
             raise KeyError(f"Key '{key}' not found in the dictionary.")
 
     def __contains__(self, key):
-        data = self._read_from_file()
-        return key in data
+        row = self.store.conn.execute(
+            "SELECT 1 FROM status WHERE doi = ? AND k = ?", (self.doi, key)
+        ).fetchone()
+        return row is not None
 
     def __len__(self):
-        data = self._read_from_file()
-        return len(data)
+        (count,) = self.store.conn.execute(
+            "SELECT COUNT(*) FROM status WHERE doi = ?", (self.doi,)
+        ).fetchone()
+        return count
 
     def __iter__(self):
-        data = self._read_from_file()
-        return iter(data)
+        rows = self.store.conn.execute(
+            "SELECT k FROM status WHERE doi = ?", (self.doi,)
+        ).fetchall()
+        return iter([key for (key,) in rows])
 
     def items(self):
-        data = self._read_from_file()
-        return data.items()
+        rows = self.store.conn.execute(
+            "SELECT k, v FROM status WHERE doi = ?", (self.doi,)
+        ).fetchall()
+        return [(key, orjson.loads(value)) for (key, value) in rows]
 
     def keys(self):
-        data = self._read_from_file()
-        return data.keys()
+        return list(self)
 
     def values(self):
-        data = self._read_from_file()
-        return data.values()
+        return [value for (_, value) in self.items()]
 
     def get(self, key, default=None):
-        data = self._read_from_file()
-        return data.get(key, default)
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+class PersistentDict(MutableMapping):
+    # SQLite-backed key/value store with the old dict-like API. The JSON
+    # version re-read and re-wrote the whole file on every access; here
+    # reads are B-tree lookups and writes are single-row upserts.
+    # MutableMapping derives contains/get/keys/values/items/pop/update
+    # from the five core methods, all served by the in-memory cache
+    def __init__(self, filepath):
+        self.filepath = filepath
+        legacy = self._read_legacy_json()
+        self.conn = sqlite3.connect(filepath, isolation_level=None, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS kv(k TEXT PRIMARY KEY, v TEXT)")
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if legacy:
+            # One transaction for the whole import
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO kv(k, v) VALUES (?, ?)",
+                [(key, orjson.dumps(value).decode()) for (key, value) in legacy.items()]
+            )
+            self.conn.execute("COMMIT")
+        # Decode the table once; reads then serve from this dict and
+        # mutations write through to SQLite, so a loop like
+        # `for k in pd: pd[k]` never touches the database
+        self._reload()
+
+    def _read_legacy_json(self):
+        # Earlier versions kept this cache as one JSON document at the
+        # same path, which sqlite3.connect cannot open. Move such a file
+        # aside (kept as .bak) and hand its contents to __init__ so they
+        # are imported into the kv table once
+        try:
+            with open(self.filepath, 'rb') as fh:
+                raw = fh.read()
+        except OSError:
+            return None
+        if not raw or raw.startswith(b'SQLite format 3'):
+            return None
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            data = None
+        os.replace(self.filepath, f"{self.filepath}.bak")
+        return data if isinstance(data, dict) else None
+
+    def _reload(self):
+        self._cache = {
+            key: orjson.loads(value)
+            for (key, value) in self.conn.execute("SELECT k, v FROM kv").fetchall()
+        }
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            raise KeyError(f"Key '{key}' not found in the dictionary.")
+        return self._cache[key]
+
+    def __setitem__(self, key, value):
+        self._cache[key] = value
+        self.conn.execute("INSERT OR REPLACE INTO kv(k, v) VALUES (?, ?)", (key, orjson.dumps(value).decode()))
+
+    def __delitem__(self, key):
+        if key not in self._cache:
+            raise KeyError(f"Key '{key}' not found in the dictionary.")
+        del self._cache[key]
+        self.conn.execute("DELETE FROM kv WHERE k = ?", (key,))
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __iter__(self):
+        return iter(self._cache)
+
+    @contextmanager
+    def batch(self):
+        # Group a burst of writes into one transaction so SQLite pays a
+        # single commit instead of one per key
+        self.conn.execute("BEGIN")
+        try:
+            yield self
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            # Resync the cache with what actually landed on disk
+            self._reload()
+            raise
+
+    def snapshot(self):
+        # Stable view for batch access patterns like "check then get";
+        # with the write-through cache this is just a shallow copy
+        return dict(self._cache)
 
     def clear(self):
-        self._write_to_file({})
+        self._cache.clear()
+        self.conn.execute("DELETE FROM kv")
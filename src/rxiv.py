@@ -1,9 +1,15 @@
 import argparse
-import requests
+import asyncio
+import httpx
 from urllib.parse import urlencode, quote
 import re
 from datetime import datetime, timedelta
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 def generate_biorxiv_url(params=None, page=1):
     # Default parameters
     default_params = {
@@ -23,53 +29,79 @@ def generate_biorxiv_url(params=None, page=1):
     # Update default parameters with provided parameters
     final_params = {**default_params, **params}
     
-    # Construct query string from the parameters
-    query_parts = [
-        quote(final_params['query']),
-        f"jcode%3A{quote(final_params['jcode'])}",
-        f"limit_from%3A{quote(final_params['limit_from'])}",
-        f"limit_to%3A{quote(final_params['limit_to'])}",
-        f"numresults%3A{final_params['numresults']}",
-        f"sort%3A{quote(final_params['sort'])}",
-        f"format_result%3A{quote(final_params['format_result'])}"
-    ]
-    query_string = '%20'.join(query_parts)
+    # Build the raw "term key:value ..." string and percent-encode it in
+    # one quote() call instead of hand-splicing %3A/%20 fragments
+    terms = ' '.join([
+        str(final_params['query']),
+        f"jcode:{final_params['jcode']}",
+        f"limit_from:{final_params['limit_from']}",
+        f"limit_to:{final_params['limit_to']}",
+        f"numresults:{final_params['numresults']}",
+        f"sort:{final_params['sort']}",
+        f"format_result:{final_params['format_result']}",
+    ])
+    query_string = quote(terms, safe='')
     
     # Construct final URL with pagination
     base_url = "https://www.biorxiv.org/search/"
     return f"{base_url}{query_string}?page={page}"
 
+# Compiled once at import instead of going through re's per-call cache
+# lookup for every page of search results
+_DOI_RE = re.compile(r'https://doi\.org/10\.\d{4,9}/[\w\.\-]+(?:/[\w\.\-]+)?')
+
 def extract_dois_from_html(html):
-    # Regular expression to find DOI URIs in the HTML
-    doi_pattern = r'https://doi\.org/10\.\d{4,9}/[\w\.\-]+(?:/[\w\.\-]+)?'
-    dois = re.findall(doi_pattern, html)
-    return dois
+    # Jump straight to the citation anchors with selectolax's C parser
+    # instead of regex-scanning the whole body; fall back to the regex
+    # when the parser is unavailable or finds nothing
+    if HTMLParser is not None:
+        dois = []
+        seen = set()
+        for node in HTMLParser(html).css('a[href*="doi.org/10."]'):
+            match = _DOI_RE.search(node.attributes.get('href') or '')
+            if match and match.group(0) not in seen:
+                seen.add(match.group(0))
+                dois.append(match.group(0))
+        if dois:
+            return dois
+    return _DOI_RE.findall(html)
 
-def search_biorxiv_and_extract_dois(query, seen_dois=None, **kwargs):
-    page = 1
-    seen_dois = seen_dois if seen_dois is not None else set()
+# How many result pages to fetch concurrently per round
+PAGE_WINDOW = 4
 
-    while True:
-        # Generate the URL using the search term, other parameters, and current page
-        params = {'query': query, **kwargs}
-        url = generate_biorxiv_url(params, page=page)
-        
-        # Download the HTML from the generated URL
-        response = requests.get(url)
-        if response.status_code == 200:
-            html = response.text
-            # Extract DOIs from the HTML
-            dois = extract_dois_from_html(html)
-            dois = set(dois) - seen_dois
-            # If no DOIs are found, break the loop
-            if not dois:
-                break
+async def _crawl_biorxiv(query, seen_dois, kwargs):
+    # Fetch pages in sliding windows so the crawl overlaps network
+    # latency across pages instead of paying one round trip per page
+    params = {'query': query, **kwargs}
+    found = []
+    page = 1
+    # The client pools keep-alive connections across the whole crawl and
+    # its transport retries failed connection attempts, matching what the
+    # old requests session provided
+    async with httpx.AsyncClient(
+        headers={'User-Agent': 'citus-rxiv-crawler'},
+        timeout=30,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        transport=httpx.AsyncHTTPTransport(retries=3),
+    ) as client:
+        while True:
+            urls = [generate_biorxiv_url(params, page=p) for p in range(page, page + PAGE_WINDOW)]
+            responses = await asyncio.gather(*(client.get(url) for url in urls))
+            for response in responses:
+                if response.status_code != 200:
+                    raise Exception(f"Failed to fetch URL: {response.url} with status code {response.status_code}")
+                dois = set(extract_dois_from_html(response.text)) - seen_dois
+                # If no new DOIs are found, the results are exhausted
+                if not dois:
+                    return found
+                found.extend(dois)
+                seen_dois |= dois
+            page += PAGE_WINDOW
 
-            yield from dois
-            seen_dois = seen_dois.union(dois)
-            page += 1
-        else:
-            raise Exception(f"Failed to fetch URL: {url} with status code {response.status_code}")
+def search_biorxiv_and_extract_dois(query, seen_dois=None, **kwargs):
+    seen_dois = seen_dois if seen_dois is not None else set()
+    yield from asyncio.run(_crawl_biorxiv(query, seen_dois, kwargs))
 
 def date_range_iterator(start_date='1970-01-01', end_date=None, interval=None):
     # Convert string dates to datetime objects
@@ -1,8 +1,10 @@
+import csv
 import os
-import json
-import pandas as pd
+import orjson
 import argparse
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 
 def get_command_line_arguments():
     parser = argparse.ArgumentParser(description='Consolidate JSON analysis files into a TSV or JSON file.')
@@ -16,37 +18,53 @@ def get_command_line_arguments():
         args.output = 'consolidated_analysis_data.json'
     return args
 
-def collect_json_data(input_directory):
-    data_list = []
-    file_count = 0
-    directory_count = 0
-
-    # Walk through directory and subdirectories to find *_analysis.json files
-    for root, dirs, files in os.walk(input_directory):
-        directory_count += 1
-        for file in files:
-            if file.endswith("_analysis.json"):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r') as json_file:
-                        data = json.load(json_file)
-
-                        # Extract DOI from file path and add to the data
-                        doi = extract_doi_from_path(file_path)
-                        data['doi'] = doi
-
-                        # Look for corresponding *_xref.json file
-                        xref_file_path = file_path.replace("_analysis.json", "_xref.json")
-                        if os.path.exists(xref_file_path):
-                            with open(xref_file_path, 'r') as xref_file:
-                                xref_data = json.load(xref_file)
-                                xref_data = extract_doi_metadata(xref_data)
-                                data.update(xref_data)
-                        data_list.append(data)
-                        file_count += 1
-                except json.JSONDecodeError as e:
-                    print(f"Error reading {file_path}: {e}")
-    return data_list, file_count, directory_count
+def _parse_analysis_file(file_path, now=None):
+    # Top-level so it pickles into process-pool workers: parse one
+    # analysis file plus its sibling xref file into a merged record
+    try:
+        with open(file_path, 'rb') as json_file:
+            data = orjson.loads(json_file.read())
+
+        # Extract DOI from file path and add to the data
+        data['doi'] = extract_doi_from_path(file_path)
+
+        # Look for corresponding *_xref.json file
+        xref_file_path = file_path.replace("_analysis.json", "_xref.json")
+        if os.path.exists(xref_file_path):
+            with open(xref_file_path, 'rb') as xref_file:
+                xref_data = orjson.loads(xref_file.read())
+                data.update(extract_doi_metadata(xref_data, now=now))
+        return data
+    except orjson.JSONDecodeError as e:
+        print(f"Error reading {file_path}: {e}")
+        return None
+
+def _walk_analysis_files(path, counts):
+    # Recursive scandir: DirEntry caches the file type from readdir, so
+    # this skips the per-path stat and string joins os.walk pays
+    counts[0] += 1
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_analysis_files(entry.path, counts)
+            elif entry.name.endswith("_analysis.json"):
+                yield entry.path
+
+def find_analysis_files(input_directory):
+    counts = [0]
+    file_paths = list(_walk_analysis_files(input_directory, counts))
+    return file_paths, counts[0]
+
+def iter_json_data(file_paths):
+    # Yield parsed rows one at a time so the writers downstream never hold
+    # the whole corpus in memory. The run timestamp is computed once here
+    # rather than once per document
+    now = datetime.now(timezone.utc).isoformat()
+    parse = partial(_parse_analysis_file, now=now)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for data in pool.map(parse, file_paths, chunksize=64):
+            if data is not None:
+                yield data
 
 def extract_doi_from_path(file_path):
     # Extract DOI from the path structure
@@ -55,7 +73,20 @@ def extract_doi_from_path(file_path):
     (_, prefix) = os.path.split(rem)
     return f"{prefix}/{suffix}"
 
-def extract_doi_metadata(doi_metadata, default_value="NA"):
+def extract_doi_metadata(doi_metadata, default_value="NA", now=None):
+    # Bind each subtree once instead of repeating the same dict lookups
+    # for every derived field
+    funders = doi_metadata.get("funder") or []
+    authors = doi_metadata.get("author") or []
+    container_title = doi_metadata.get("container-title") or []
+
+    # One walk over funders produces both names and awards
+    funder_names = []
+    funder_awards = []
+    for funder in funders:
+        funder_names.append(funder.get("name", "Unknown funder"))
+        funder_awards.extend(funder.get("award", []))
+
     extracted_data = {
         # Reference Count
         "reference_count": doi_metadata.get("reference-count", default_value),
@@ -63,27 +94,28 @@ def extract_doi_metadata(doi_metadata, default_value="NA"):
 
         # Publisher Information
         "publisher": doi_metadata.get("publisher", default_value),
-        "journal_title": doi_metadata.get("container-title", [default_value])[0] if doi_metadata.get("container-title", []) else default_value,
+        "journal_title": container_title[0] if container_title else default_value,
 
         # Funding Sources
-        "funder_names": [funder.get("name", "Unknown funder") for funder in doi_metadata.get("funder", [])],
-        "funder_awards": [award for funder in doi_metadata.get("funder", []) for award in funder.get("award", [])],
-        "number_of_funders": len(doi_metadata.get("funder", [])),
+        "funder_names": funder_names,
+        "funder_awards": funder_awards,
+        "number_of_funders": len(funders),
 
-        "author_count": len(doi_metadata.get("author", [])),
+        "author_count": len(authors),
 
         # Boolean Fields
         "is_published_print": "published-print" in doi_metadata,
         "is_published_online": "published-online" in doi_metadata,
 
         # timestamp
-        "_created_at": datetime.utcnow().isoformat()
+        "_created_at": now or datetime.now(timezone.utc).isoformat()
     }
 
     if 'URL' in doi_metadata:
         extracted_data['URL'] = doi_metadata.get("URL")
 
-    publish_date = doi_metadata.get("published", {}).get("date-parts", [[]])[0]
+    date_parts = (doi_metadata.get("published") or {}).get("date-parts")
+    publish_date = date_parts[0] if date_parts else ()
     if len(publish_date) == 3:
         extracted_data['publication_year'] = publish_date[0]
         extracted_data['publication_month'] = publish_date[1]
@@ -96,39 +128,52 @@ def extract_doi_metadata(doi_metadata, default_value="NA"):
 
     return extracted_data
 
-def create_dataframe(data_list):
-    if not data_list:
+def save_data_to_tsv(rows, output_file):
+    # The header needs the union of all row keys, so stream twice: spool
+    # rows to a temporary JSONL file while accumulating fieldnames, then
+    # replay the spool through the writer. Peak memory stays at one row
+    # instead of the whole corpus
+    fieldnames = set()
+    row_count = 0
+    spool_path = output_file + '.rows'
+    with open(spool_path, 'wb') as spool:
+        for row in rows:
+            fieldnames.update(row)
+            spool.write(orjson.dumps(row) + b'\n')
+            row_count += 1
+
+    if not row_count:
         raise ValueError("No data found. Please ensure the directory contains valid *_analysis.json files.")
 
-    # Create a Pandas DataFrame from the collected data
-    df = pd.DataFrame(data_list)
-    return df
-
-def save_dataframe_to_tsv(df, output_file):
-    # Save the consolidated data to a TSV file
-    df.to_csv(output_file, sep='\t', index=False)
-
-def save_data_to_json(data_list, output_file):
-    # Save the consolidated data to a JSON file
-    with open(output_file, 'w') as json_file:
-        json.dump(data_list, json_file, indent=4)
+    with open(spool_path, 'rb') as spool, open(output_file, 'w', newline='') as tsv_file:
+        writer = csv.DictWriter(tsv_file, fieldnames=sorted(fieldnames), delimiter='\t', extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(orjson.loads(line) for line in spool)
+    os.unlink(spool_path)
+    return row_count
+
+def save_data_to_json(rows, output_file):
+    # Newline-delimited JSON: one record per line, written as produced
+    row_count = 0
+    with open(output_file, 'wb') as json_file:
+        for row in rows:
+            json_file.write(orjson.dumps(row) + b'\n')
+            row_count += 1
+    return row_count
 
 def main():
     # Get command line arguments
     args = get_command_line_arguments()
 
-    # Collect data from JSON files
-    data_list, file_count, directory_count = collect_json_data(args.path)
+    # Find the analysis files, then stream parsed rows into the writer
+    file_paths, directory_count = find_analysis_files(args.path)
+    rows = iter_json_data(file_paths)
 
     # Save data in the desired format
     if args.format == 'tsv':
-        # Create a DataFrame from the collected data
-        df = create_dataframe(data_list)
-        # Save the DataFrame to a TSV file
-        save_dataframe_to_tsv(df, args.output)
+        file_count = save_data_to_tsv(rows, args.output)
     elif args.format == 'json':
-        # Save the data list to a JSON file
-        save_data_to_json(data_list, args.output)
+        file_count = save_data_to_json(rows, args.output)
 
     # Print summary statistics
     print(f"Consolidated data saved to {args.output}")
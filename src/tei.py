@@ -1,8 +1,22 @@
+import logging
+import mmap
 import sys
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    # Fall back to the stdlib parser (C-accelerated _elementtree in
+    # modern Python); everything works, just without compiled XPath
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+    logging.getLogger(__name__).warning(
+        "lxml is not installed; falling back to xml.etree.ElementTree for TEI parsing")
 
 # Define the TEI namespace
-ns = {'tei': 'http://www.tei-c.org/ns/1.0'}
+TEI_NS = 'http://www.tei-c.org/ns/1.0'
+TEI_NS_TAG = f'{{{TEI_NS}}}'
+ns = {'tei': TEI_NS}
 
 # Define default sections order
 DEFAULT_SECTIONS_ORDER = (
@@ -12,150 +26,248 @@ DEFAULT_SECTIONS_ORDER = (
   'data_sources', 'article_status'
 )
 
+def _xp(expr):
+    # Compile each path once at import with the namespace map bound in,
+    # instead of re-parsing the expression on every find/findall call
+    if _HAVE_LXML:
+        return ET.XPath(expr, namespaces=ns)
+
+    # Stdlib fallback: same call shape, with $var substitution done by
+    # hand since ElementPath has no XPath variables
+    def finder(elem, **variables):
+        path = expr
+        for (name, value) in variables.items():
+            path = path.replace(f'${name}', f'"{value}"')
+        return elem.findall(path, ns)
+    return finder
+
+_XP_TITLE = _xp('.//tei:titleStmt/tei:title[@type="main"]')
+_XP_AUTHORS = _xp('.//tei:sourceDesc//tei:analytic//tei:author')
+_XP_ABSTRACT = _xp('.//tei:profileDesc/tei:abstract')
+_XP_BODY = _xp('.//tei:body')
+_XP_DIV = _xp('tei:div')
+_XP_HEAD = _xp('tei:head')
+_XP_P = _xp('tei:p')
+_XP_BIBL = _xp('.//tei:listBibl/tei:biblStruct')
+_XP_FUNDERS = _xp('.//tei:funder/tei:orgName[@type="full"]')
+_XP_PUBLISHER = _xp('.//tei:publicationStmt/tei:publisher')
+_XP_AVAILABILITY = _xp('.//tei:publicationStmt/tei:availability[@status]')
+_XP_DATA_AVAILABILITY = _xp('.//tei:back//tei:div[@type="availability"]/tei:p')
+_XP_SUBMISSION_NOTE = _xp('.//tei:sourceDesc/tei:biblStruct/tei:note[@type="submission"]')
+
+def _first(nodes):
+    return nodes[0] if nodes else None
+
 def get_title(root):
-    title = root.find('.//tei:titleStmt/tei:title[@type="main"]', ns)
+    title = _first(_XP_TITLE(root))
     return f"# {title.text.strip()}\n" if title is not None and title.text else "# Untitled\n\n"
 
+def _affiliation_parts(affiliation):
+    # One pass over the affiliation subtree for department, institution
+    # and country
+    dept = institution = country = None
+    for element in affiliation.iter():
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+        local = _localname(tag)
+        if local == 'orgName':
+            org_type = element.get('type')
+            if org_type == 'department' and dept is None:
+                dept = element.text
+            elif org_type == 'institution' and institution is None:
+                institution = element.text
+        elif local == 'country' and country is None:
+            country = element.text
+    return (dept or "", institution or "", country or "")
+
 def get_authors(root):
-    output = "## Authors\n\n"
-    authors = root.findall('.//tei:sourceDesc//tei:analytic//tei:author', ns)
+    buf = ["## Authors\n\n"]
+    authors = _XP_AUTHORS(root)
     if authors:
         for author in authors:
-            pers_name = author.find('tei:persName', ns)
+            # Pick the author's child nodes up in one scan rather than a
+            # find per field
+            pers_name = affiliation = email = None
+            for child in author:
+                tag = child.tag
+                if not isinstance(tag, str):
+                    continue
+                local = _localname(tag)
+                if local == 'persName' and pers_name is None:
+                    pers_name = child
+                elif local == 'affiliation' and affiliation is None:
+                    affiliation = child
+                elif local == 'email' and email is None:
+                    email = child
+
             if pers_name is None:
                 continue
 
-            first_name = pers_name.find('tei:forename[@type="first"]', ns)
-            first_name_text = first_name.text if first_name is not None else ""
-            
-            middle_name = pers_name.find('tei:forename[@type="middle"]', ns)
-            middle_name_text = middle_name.text if middle_name is not None else ""
-            
-            last_name = pers_name.find('tei:surname', ns)
-            last_name_text = last_name.text if last_name is not None else ""
-            
-            author_name = f"**{first_name_text} {middle_name_text} {last_name_text}**".strip()
+            (first_name, middle_name, last_name) = _persname_parts(pers_name)
+            author_name = f"**{first_name} {middle_name} {last_name}**".strip()
 
             affiliation_info = ""
-            affiliation = author.find('tei:affiliation', ns)
             if affiliation is not None:
-                dept = affiliation.find('tei:orgName[@type="department"]', ns)
-                institution = affiliation.find('tei:orgName[@type="institution"]', ns)
-                country = affiliation.find('tei:address/tei:country', ns)
-                
-                dept_text = dept.text if dept is not None else ""
-                institution_text = institution.text if institution is not None else ""
-                country_text = country.text if country is not None else ""
-                
-                affiliation_info = f", {dept_text}, {institution_text}, {country_text}".strip(", ")
-
-            email = author.find('tei:email', ns)
+                (dept, institution, country) = _affiliation_parts(affiliation)
+                affiliation_info = f", {dept}, {institution}, {country}".strip(", ")
+
             email_text = f", Email: {email.text}" if email is not None else ""
-            
-            output += f"- {author_name}{affiliation_info}{email_text}\n"
-        return output + "\n"
+
+            buf.append(f"- {author_name}{affiliation_info}{email_text}\n")
+        return ''.join(buf) + "\n"
     return ""
 
+def _collect_text(elem):
+    # itertext() yields text and tails in document order from inside the
+    # parser library (C code under lxml), replacing the hand-rolled
+    # iter() + .text/.tail stitching. Note iter() visited tails in
+    # traversal order, which could misplace a tail after nested markup;
+    # itertext() is both faster and correctly ordered
+    return ''.join(elem.itertext())
+
 def get_abstract(root):
-    abstract = root.find('.//tei:profileDesc/tei:abstract', ns)
+    abstract = _first(_XP_ABSTRACT(root))
     if abstract is not None:
-        abstract_text = ""
-        for element in abstract.iter():
-            if element.tag == f"{{{ns['tei']}}}ref":
-                ref_content = element.text if element.text else ""
-                abstract_text += ref_content
-            elif element.text:
-                abstract_text += element.text
-            if element.tail:
-                abstract_text += element.tail
+        # The ref branch emitted .text just like the general case, so no
+        # tag check is needed
+        abstract_text = _collect_text(abstract)
         return f"## Abstract\n\n{abstract_text.strip()}\n\n"
     return ""
 
 def get_body(root):
-    output = "## Body\n\n"
-    body = root.find('.//tei:text/tei:body', ns)
+    body = _first(_XP_BODY(root))
     if body is not None:
-        for div in body.findall('tei:div', ns):
-            section_title = div.find('tei:head', ns)
+        chunks = ["## Body\n\n"]
+        for div in _XP_DIV(body):
+            section_title = _first(_XP_HEAD(div))
             if section_title is not None and section_title.text:
-                output += f"### {section_title.text.strip()}\n\n"
-
-            for paragraph in div.findall('tei:p', ns):
-                paragraph_text = ""
-                for element in paragraph.iter():
-                    if element.tag == f"{{{ns['tei']}}}ref":
-                        ref_content = element.text if element.text else ""
-                        paragraph_text += ref_content
-                    elif element.text:
-                        paragraph_text += element.text
-                    if element.tail:
-                        paragraph_text += element.tail
-                output += paragraph_text.strip() + "\n\n"
-        return output + "\n"
+                chunks.append(f"### {section_title.text.strip()}\n\n")
+
+            for paragraph in _XP_P(div):
+                chunks.append(_collect_text(paragraph).strip() + "\n\n")
+        return ''.join(chunks) + "\n"
     return ""
 
+def _localname(tag):
+    return tag.rpartition('}')[2]
+
+def _persname_parts(pers_name):
+    # One pass over the persName children instead of three finds
+    first_name = middle_name = last_name = None
+    for child in pers_name:
+        tag = child.tag
+        if not isinstance(tag, str):
+            continue
+        local = _localname(tag)
+        if local == 'forename':
+            forename_type = child.get('type')
+            if forename_type == 'first' and first_name is None:
+                first_name = child.text
+            elif forename_type == 'middle' and middle_name is None:
+                middle_name = child.text
+        elif local == 'surname' and last_name is None:
+            last_name = child.text
+    return (first_name or "", middle_name or "", last_name or "")
+
+def _collect_ref_fields(ref):
+    # Walk each biblStruct subtree once, dispatching on tag, instead of
+    # running seven descendant searches per reference
+    title = journal = date_text = page_from = page_to = None
+    pers_names = []
+    for element in ref.iter():
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+        local = _localname(tag)
+        if local == 'title':
+            if title is None:
+                title = element.text
+            if journal is None and element.get('level') == 'j':
+                journal = element.text
+        elif local == 'author':
+            for child in element:
+                if isinstance(child.tag, str) and _localname(child.tag) == 'persName':
+                    pers_names.append(child)
+        elif local == 'date':
+            if date_text is None and element.get('type') == 'published':
+                date_text = element.get('when')
+        elif local == 'biblScope':
+            if element.get('unit') == 'page':
+                if page_from is None and element.get('from') is not None:
+                    page_from = element.text
+                if page_to is None and element.get('to') is not None:
+                    page_to = element.text
+    return (title, journal, date_text, page_from, page_to, pers_names)
+
 def get_references(root):
-    output = "## References\n\n"
-    references = root.findall('.//tei:listBibl/tei:biblStruct', ns)
+    buf = ["## References\n\n"]
+    references = _XP_BIBL(root)
     for idx, ref in enumerate(references, start=1):
-        title = ref.find('.//tei:title', ns)
-        title_text = title.text if title is not None else "Untitled"
+        (title, journal, date_text, page_from, page_to, pers_names) = _collect_ref_fields(ref)
+        title_text = title if title is not None else "Untitled"
 
-        authors = ref.findall('.//tei:author/tei:persName', ns)
         author_names = []
-        for author in authors:
-            first_name = author.find('tei:forename[@type="first"]', ns)
-            first_name_text = first_name.text if first_name is not None else ""
-            
-            middle_name = author.find('tei:forename[@type="middle"]', ns)
-            middle_name_text = middle_name.text if middle_name is not None else ""
-            
-            last_name = author.find('tei:surname', ns)
-            last_name_text = last_name.text if last_name is not None else ""
-            
-            author_names.append(f"{first_name_text} {middle_name_text} {last_name_text}".strip())
-        
-        authors_text = ", ".join(author_names) if author_names else "Unknown authors"
-        
-        journal = ref.find('.//tei:title[@level="j"]', ns)
-        journal_text = journal.text if journal is not None else "Unknown journal"
-
-        date = ref.find('.//tei:date[@type="published"]', ns)
-        date_text = date.get('when') if date is not None else "Unknown date"
+        for pers_name in pers_names:
+            (first_name, middle_name, last_name) = _persname_parts(pers_name)
+            author_names.append(f"{first_name} {middle_name} {last_name}".strip())
 
-        page_from = ref.find('.//tei:biblScope[@unit="page"][@from]', ns)
-        page_to = ref.find('.//tei:biblScope[@unit="page"][@to]', ns)
-        pages_text = f"pp. {page_from.text}-{page_to.text}" if page_from is not None and page_to is not None else f"p. {page_from.text}" if page_from is not None else ""
+        authors_text = ", ".join(author_names) if author_names else "Unknown authors"
+        journal_text = journal if journal is not None else "Unknown journal"
+        date_text = date_text if date_text is not None else "Unknown date"
+        pages_text = f"pp. {page_from}-{page_to}" if page_from is not None and page_to is not None else f"p. {page_from}" if page_from is not None else ""
 
-        output += f"{idx}. {authors_text}. *\"{title_text}\"*. {journal_text}, {date_text}, {pages_text}\n"
-    return output + "\n"
+        buf.append(f"{idx}. {authors_text}. *\"{title_text}\"*. {journal_text}, {date_text}, {pages_text}\n")
+    return ''.join(buf) + "\n"
 
 def get_funding(root):
-    output = "## Funding Sources\n\n"
-    funders = root.findall('.//tei:funder/tei:orgName[@type="full"]', ns)
+    funders = _XP_FUNDERS(root)
+    if not funders:
+        return ""
+    buf = ["## Funding Sources\n\n"]
     for funder in funders:
-        output += f"- {funder.text}\n"
-    return output + "\n" if funders else ""
+        buf.append(f"- {funder.text}\n")
+    return ''.join(buf) + "\n"
 
 def get_publisher(root):
-    publisher = root.find('.//tei:publicationStmt/tei:publisher', ns)
+    publisher = _first(_XP_PUBLISHER(root))
     return f"## Publisher\n\n{publisher.text}\n\n" if publisher is not None and publisher.text else ""
 
 def get_license(root):
-    availability = root.find('.//tei:publicationStmt/tei:availability[@status]', ns)
+    availability = _first(_XP_AVAILABILITY(root))
     status = availability.get('status') if availability is not None else "unknown"
     return f"## License\n\n**Status:** {status}\n\n"
 
 def get_data_sources(root):
-    data_availability = root.find('.//tei:back//tei:div[@type="availability"]/tei:p', ns)
+    data_availability = _first(_XP_DATA_AVAILABILITY(root))
     if data_availability is not None and data_availability.text:
         return f"## Data Sources\n\n{data_availability.text.strip()}\n\n"
     return ""
 
 def get_article_status(root):
-    status = root.find('.//tei:sourceDesc/tei:biblStruct/tei:note[@type="submission"]', ns)
+    status = _first(_XP_SUBMISSION_NOTE(root))
     return f"## Article Status\n\n{status.text.strip()}\n\n" if status is not None and status.text else ""
 
+# Which top-level TEI container each section lives in: metadata sections
+# stay inside teiHeader, content sections inside text. Scoping the `.//`
+# searches this way keeps the ten extractors from each re-walking the
+# entire document
+_XP_HEADER = _xp('tei:teiHeader')
+_XP_TEXT = _xp('tei:text')
+
+SECTION_SCOPES = {
+    'title': 'header',
+    'authors': 'header',
+    'abstract': 'header',
+    'funding': 'header',
+    'publisher': 'header',
+    'license': 'header',
+    'article_status': 'header',
+    'body': 'text',
+    'references': 'text',
+    'data_sources': 'text',
+}
+
 SECTION_FUNCTIONS = {
     'title': get_title,
     'authors': get_authors,
@@ -169,6 +281,19 @@ SECTION_FUNCTIONS = {
     'article_status': get_article_status,
 }
 
+def parse_tei(file_path):
+    # Feed the parser from an mmap'd view so re-runs read straight out of
+    # the OS page cache instead of copying through stdio buffers
+    with open(file_path, 'rb') as fh:
+        try:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return ET.parse(mm).getroot()
+        except (ValueError, OSError):
+            # zero-length file or platform without mmap support
+            return ET.parse(fh).getroot()
+
 def convert_tei_to_text(file_path, output_path=None, section_order=None):
     section_order = section_order or DEFAULT_SECTIONS_ORDER
 
@@ -180,18 +305,28 @@ def convert_tei_to_text(file_path, output_path=None, section_order=None):
     output_path = output_path or f"{file_path}.txt"
 
     # Parse the XML file
-    tree = ET.parse(file_path)
-    root = tree.getroot()
+    root = parse_tei(file_path)
 
-    # Collect all requested sections
-    output = ""
-    for section in section_order:
-        output += SECTION_FUNCTIONS[section](root)
-    
-    with open(output_path, 'w') as fh:
-        fh.write(output)
+    # Locate the two top-level containers once, then hand each section
+    # only the subtree it actually reads
+    header = _first(_XP_HEADER(root))
+    text = _first(_XP_TEXT(root))
+    scopes = {
+        'header': header if header is not None else root,
+        'text': text if text is not None else root,
+    }
+
+    # Stream each section to disk as it is produced instead of building
+    # the whole document in memory first and writing it in one go; the
+    # sections are still kept for the returned string
+    sections = []
+    with open(output_path, 'w', buffering=1 << 20) as fh:
+        for section in section_order:
+            text = SECTION_FUNCTIONS[section](scopes[SECTION_SCOPES[section]])
+            fh.write(text)
+            sections.append(text)
 
-    return output
+    return ''.join(sections)
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
@@ -1,9 +1,10 @@
 import argparse
+import functools
 import logging
+import logging.handlers
 import multiprocessing
-import queue
-import time
 import colorama
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from doi import resolve_doi
 import rxiv
 import os
@@ -34,110 +35,105 @@ console_handler = logging.StreamHandler()
 console_handler.setFormatter(ColoredFormatter())
 logger.addHandler(console_handler)
 
-# Setup logger for file output (without colors)
+# Setup logger for file output (without colors), buffered so records hit
+# the disk in batches of up to 1024 instead of one write syscall each;
+# errors and worse flush the buffer immediately
 file_handler = logging.FileHandler('process_dois.log')
 file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 file_handler.setFormatter(file_formatter)
-logger.addHandler(file_handler)
+buffered_handler = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+logger.addHandler(buffered_handler)
 
 logger.setLevel(logging.DEBUG)
 
-class DOIWorker(multiprocessing.Process):
-    def __init__(self, doi_queue, running_event, cache_path):
-        super().__init__()
-        self.doi_queue = doi_queue
-        self.running_event = running_event
-        self.cache_path = cache_path
-
-    def run(self):
-        logger.info(f"⭐ Worker {self.name} has started!")
-        while self.running_event.is_set():
-            try:
-                doi = self.doi_queue.get(timeout=1)  # Get DOI from the queue with a timeout
-                logger.info(f"🔍 Worker {self.name} got DOI: {doi}")
-                
-                # Run DOI processing in a separate process
-                process = multiprocessing.Process(target=self.process_doi, args=(doi,))
-                process.start()
-                while process.is_alive():
-                    process.join(timeout=0.5)
-                    if not self.running_event.is_set():
-                        logger.warning(f"🛑 Worker {self.name} stopping process for DOI: {doi} due to system stop signal...")
-                        process.terminate()
-                        process.join()
-                        break
-
-                if process.exitcode == 0:
-                    logger.info(f"✅ Worker {self.name} finished processing DOI: {doi}")
-                else:
-                    logger.error(f"❌ Worker {self.name} failed to process DOI: {doi}")
-
-                self.doi_queue.task_done()
-            except queue.Empty:
-                if not self.running_event.is_set():
-                    logger.info(f"🚯 Worker {self.name} stopping due to system stop signal...")
-                    break
-
-    def process_doi(self, doi):
-        try:
-            doi_obj = resolve_doi(doi, cache_path=self.cache_path)
-            text_path = doi_obj.analyze_article()
-        except Exception as e:
-            logger.error(f"An error occurred while processing DOI {doi}: {e}\n{format_exc()}")
-
-
-def run_workers(doi_queue, num_workers, running_event, cache_path):
-    workers = []
-    for _ in range(num_workers):
-        worker = DOIWorker(doi_queue, running_event, cache_path)
-        worker.start()
-        workers.append(worker)
-    return workers
+# Each pool worker binds its cache path once at startup instead of
+# shipping it with every job
+_WORKER_CACHE_PATH = None
+
+def _init_worker(cache_path, log_queue):
+    global _WORKER_CACHE_PATH
+    _WORKER_CACHE_PATH = cache_path
+    # Workers feed records to the parent's listener through one queue
+    # rather than contending on the log file themselves
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_doi_cached(doi, cache_path):
+    # Per-worker memo: a DOI requeued within the same run (overlapping
+    # date windows, retries) reuses the already-built object instead of
+    # re-reading its cache files from disk
+    return resolve_doi(doi, cache_path=cache_path)
+
+def process_doi(doi):
+    try:
+        doi_obj = _resolve_doi_cached(doi, _WORKER_CACHE_PATH)
+        doi_obj.analyze_article()
+        return True
+    except Exception as e:
+        logger.error(f"An error occurred while processing DOI {doi}: {e}\n{format_exc()}")
+        return False
 
 
 def process_dois(query, num_workers, start_date, end_date, interval, cache_path):
-    doi_queue = multiprocessing.JoinableQueue()
-    running_event = multiprocessing.Event()
-    running_event.set()
-
-    # Start the worker processes
-    workers = run_workers(doi_queue, num_workers, running_event, cache_path)
-    
     # Ensure cache directory exists
     queries_path = os.path.join(cache_path, "queries")
     os.makedirs(queries_path, exist_ok=True)
-    
+
     # Fetch DOIs using rxiv module
     logger.info(f"🔎 Searching for DOIs with query: {query} from {start_date} to {end_date}...")
     search_cache_path = os.path.join(queries_path, f"__cache__{query}_{interval}.json")
     search_cache = PersistentDict(search_cache_path)
-    
-    for (start, end) in rxiv.date_range_iterator(start_date=start_date, end_date=end_date, interval=interval):
-        key = f"{start},{end}"
-        if key not in search_cache:
-            logger.info(f"Searching from Start Date: {start} to End Date: {end}")
-            try:
-                dois = list(rxiv.search_biorxiv_and_extract_dois(query, limit_from=start, limit_to=end))
-                search_cache[key] = dois
-            except Exception as e:
-                logger.error(f"An error occurred while fetching DOIs: {e}\n{format_exc()}")
-                continue
-        else:
-            dois = search_cache[key]
-
-        for doi in dois:
-            doi_queue.put(doi)
-            logger.info(f"🛥 DOI added: {doi}")
 
+    # The listener in this process owns the console and buffered file
+    # handlers; worker records arrive over the queue
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logger.handlers, respect_handler_level=True)
+    listener.start()
+
+    # One persistent pool of workers: each DOI is a submitted job, not a
+    # freshly forked process paying interpreter startup per article
+    pool = ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_worker,
+        initargs=(cache_path, log_queue)
+    )
+    futures = {}
     try:
-        doi_queue.join()  # Block until all tasks are done
+        # One transaction covers the whole sweep, so a fine-grained
+        # --interval doesn't commit once per date range
+        with search_cache.batch():
+            for (start, end) in rxiv.date_range_iterator(start_date=start_date, end_date=end_date, interval=interval):
+                key = f"{start},{end}"
+                if key not in search_cache:
+                    logger.info(f"Searching from Start Date: {start} to End Date: {end}")
+                    try:
+                        dois = list(rxiv.search_biorxiv_and_extract_dois(query, limit_from=start, limit_to=end))
+                        search_cache[key] = dois
+                    except Exception as e:
+                        logger.error(f"An error occurred while fetching DOIs: {e}\n{format_exc()}")
+                        continue
+                else:
+                    dois = search_cache[key]
+
+                for doi in dois:
+                    futures[pool.submit(process_doi, doi)] = doi
+                    logger.info(f"🛥 DOI added: {doi}")
+
+        for future in as_completed(futures):
+            doi = futures[future]
+            if future.result():
+                logger.info(f"✅ Finished processing DOI: {doi}")
+            else:
+                logger.error(f"❌ Failed to process DOI: {doi}")
     finally:
-        # Ensure all workers finish processing
         logger.info("✅ Stopping all workers...")
-        running_event.clear()  # Signal all workers to stop
-        for worker in workers:
-            worker.join()
+        pool.shutdown(wait=True, cancel_futures=True)
         logger.info("✅ All workers have been stopped.")
+        listener.stop()
+        buffered_handler.flush()
 
 
 def main():